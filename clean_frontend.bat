@@ -0,0 +1,3 @@
+REM Removes the modules built by compile_frontend.bat, so that the frontend runs from its sources again.
+del /Q frontend\python\*.pyd
+rmdir /S /Q frontend\python\build
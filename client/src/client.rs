@@ -1,4 +1,4 @@
-use std::sync::Arc;
+use std::time::Duration;
 
 use anyhow::Result;
 
@@ -13,7 +13,8 @@ use crate::main_thread::MainThreadHandle;
 /// - The frontend calls [Client::new] which initializes the client and kicks off background threads to run the
 ///   simulation and other such things.
 /// - The frontend then repeatedly calls [Client::dequeue_service_requests] to get service requests such as speech and
-///   shutdown, and [Client::get_ui_stack] to get updated UI stacks.
+///   shutdown, and [Client::get_ui_stack_delta] to get changes to the UI stack.  [Client::wait_for_work] tells it
+///   whether there is anything new to fetch, optionally blocking until there is.
 pub struct Client {
     main_thread: MainThreadHandle,
 }
@@ -34,8 +35,24 @@ impl Client {
         Ok(())
     }
 
-    pub fn get_ui_stack(&self) -> Result<Option<Arc<frontend::UiStack>>> {
-        Ok(self.main_thread.ui_stack().get_stack())
+    /// Block for up to `timeout` until there is a new UI stack or service requests for the frontend.
+    ///
+    /// Returns true if there is work to do.
+    pub fn wait_for_work(&self, timeout: Duration) -> bool {
+        self.main_thread.work_notifier().wait(timeout)
+    }
+
+    /// Get the changes to the UI stack since the last call to this function, or `None` if nothing changed.
+    pub fn get_ui_stack_delta(&self) -> Result<Option<frontend::UiStackDelta>> {
+        Ok(self.main_thread.ui_stack().get_delta())
+    }
+
+    /// Make the next call to [Client::get_ui_stack_delta] report the whole stack, and wake the frontend to fetch it.
+    ///
+    /// The frontend calls this if it failed to handle a delta, after dropping its own stack.
+    pub fn resync_ui_stack(&self) {
+        self.main_thread.ui_stack().resync();
+        self.main_thread.work_notifier().notify();
     }
 
     /// Send a request to a given UI element to complete with the specified value.
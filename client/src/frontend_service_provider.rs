@@ -1,23 +1,35 @@
 //! Provides the code to let the client call into the frontend.
+use std::sync::Arc;
+
 use anyhow::Result;
 use crossbeam::channel as chan;
 
 use ammo_protos::frontend::{self, ServiceRequest};
 
+use crate::work_notifier::WorkNotifier;
+
 pub struct FrontendServiceProvider {
     request_sender: chan::Sender<ServiceRequest>,
     request_receiver: chan::Receiver<ServiceRequest>,
+    work_notifier: Arc<WorkNotifier>,
 }
 
 impl FrontendServiceProvider {
-    pub fn new() -> Self {
+    pub fn new(work_notifier: Arc<WorkNotifier>) -> Self {
         let (request_sender, request_receiver) = chan::unbounded();
         Self {
             request_sender,
             request_receiver,
+            work_notifier,
         }
     }
 
+    fn send_request(&self, req: ServiceRequest) -> Result<()> {
+        self.request_sender.send(req)?;
+        self.work_notifier.notify();
+        Ok(())
+    }
+
     pub fn speak(&self, text: &str, interrupt: bool) -> Result<()> {
         let command_payload = frontend::SpeakRequest {
             interrupt,
@@ -26,8 +38,7 @@ impl FrontendServiceProvider {
         let req: frontend::ServiceRequest = frontend::ServiceRequest {
             service: Some(frontend::service_request::Service::Speak(command_payload)),
         };
-        self.request_sender.send(req)?;
-        Ok(())
+        self.send_request(req)
     }
 
     pub fn shutdown(&self) -> Result<()> {
@@ -36,8 +47,7 @@ impl FrontendServiceProvider {
                 Default::default(),
             )),
         };
-        self.request_sender.send(cmd)?;
-        Ok(())
+        self.send_request(cmd)
     }
 
     /// Extracct all of the pending commands.
@@ -52,6 +62,6 @@ impl FrontendServiceProvider {
 
 impl Default for FrontendServiceProvider {
     fn default() -> Self {
-        Self::new()
+        Self::new(Default::default())
     }
 }
@@ -3,6 +3,7 @@ pub mod frontend_service_provider;
 pub mod main_thread;
 pub mod ui_elements;
 pub mod ui_stack;
+pub mod work_notifier;
 pub mod world_state;
 
 pub use client::*;
@@ -5,11 +5,13 @@ use anyhow::Result;
 use crate::frontend_service_provider::FrontendServiceProvider;
 use crate::ui_elements::{SimpleMenuBuilder, SimpleMenuOutcome};
 use crate::ui_stack::{UiStack, UiStackHandle};
+use crate::work_notifier::WorkNotifier;
 use crate::world_state::WorldState;
 
 pub struct MainThreadHandle {
     ui_stack_handle: UiStackHandle,
     frontend_service_provider: Arc<FrontendServiceProvider>,
+    work_notifier: Arc<WorkNotifier>,
 }
 
 fn main_thread(
@@ -53,14 +55,16 @@ fn main_thread(
 }
 
 pub fn spawn_main_thread() -> Result<MainThreadHandle> {
-    let (ui_stack, ui_stack_handle) = UiStack::new_with_handle();
+    let work_notifier = Arc::new(WorkNotifier::new());
+    let (ui_stack, ui_stack_handle) = UiStack::new_with_handle(work_notifier.clone());
     let world_state = WorldState::new();
-    let frontend_service_provider = Arc::new(FrontendServiceProvider::new());
+    let frontend_service_provider = Arc::new(FrontendServiceProvider::new(work_notifier.clone()));
     let fsp_cloned = frontend_service_provider.clone();
     std::thread::spawn(move || main_thread(ui_stack, fsp_cloned, world_state));
     Ok(MainThreadHandle {
         ui_stack_handle,
         frontend_service_provider,
+        work_notifier,
     })
 }
 
@@ -72,4 +76,8 @@ impl MainThreadHandle {
     pub fn frontend_service_provider(&self) -> &FrontendServiceProvider {
         &self.frontend_service_provider
     }
+
+    pub fn work_notifier(&self) -> &WorkNotifier {
+        &self.work_notifier
+    }
 }
@@ -7,10 +7,12 @@
 //! Actions are addressed to elements by key, not index.  Under the assumption that the frontend is going to pick up the
 //! next state the next time it ticks, actions to non-existant elements are simply ignored.
 //!
-//! The stack is driven by a background thread and communicated with from the frontend via a `UiStackHandle`
+//! The stack is driven by a background thread and communicated with from the frontend via a `UiStackHandle`.  Rather
+//! than the whole stack, the frontend is handed deltas against the last stack it saw.
 //!
 //! IMPORTANT: it is critical to iterate from the top of the stack to the bottom so that elements may remove themselves.
-use std::sync::Arc;
+use std::collections::HashSet;
+use std::sync::{Arc, Mutex};
 
 use anyhow::Result;
 use crossbeam::channel as chan;
@@ -19,6 +21,7 @@ use uuid::Uuid;
 use ammo_protos::frontend;
 
 use crate::ui_elements::{UiElement, UiElementOperationResult};
+use crate::work_notifier::WorkNotifier;
 
 enum UiActionKind {
     Cancel,
@@ -50,14 +53,20 @@ pub struct UiStack {
 
     handle_state: Arc<UiStackHandleState>,
     action_receiver: chan::Receiver<UiAction>,
+
+    /// Told whenever we publish a stack which differs from the last one.
+    work_notifier: Arc<WorkNotifier>,
 }
 
 pub struct UiStackHandle {
     state: Arc<UiStackHandleState>,
+
+    /// The last stack the frontend was sent a delta against.
+    sent: Mutex<Option<Arc<frontend::UiStack>>>,
 }
 
 impl UiStack {
-    pub fn new_with_handle() -> (UiStack, UiStackHandle) {
+    pub fn new_with_handle(work_notifier: Arc<WorkNotifier>) -> (UiStack, UiStackHandle) {
         let (action_sender, action_receiver) = chan::unbounded();
 
         let hs: Arc<UiStackHandleState> = Arc::new(UiStackHandleState {
@@ -69,9 +78,13 @@ impl UiStack {
             current_element_states: Default::default(),
             handle_state: hs.clone(),
             action_receiver,
+            work_notifier,
         };
 
-        let handle = UiStackHandle { state: hs };
+        let handle = UiStackHandle {
+            state: hs,
+            sent: Default::default(),
+        };
         (stack, handle)
     }
 
@@ -132,7 +145,12 @@ impl UiStack {
                 .iter()
                 .map(|x| x.as_ref().expect("Should be initialized").clone()),
         );
-        self.handle_state.stack.store(Some(Arc::new(stack)));
+
+        // Only publish stacks which changed, so that the frontend isn't woken up for nothing.
+        if self.handle_state.stack.load().as_deref() != Some(&stack) {
+            self.handle_state.stack.store(Some(Arc::new(stack)));
+            self.work_notifier.notify();
+        }
         Ok(())
     }
 
@@ -172,8 +190,53 @@ impl UiStack {
 }
 
 impl UiStackHandle {
-    pub fn get_stack(&self) -> Option<Arc<frontend::UiStack>> {
-        self.state.stack.load_full()
+    /// Get the changes to the stack since the last call, or `None` if nothing changed.
+    ///
+    /// Only entries being pushed and removed are reported; a new state for an entry which was already sent is not.
+    pub fn get_delta(&self) -> Option<frontend::UiStackDelta> {
+        let current = self.state.stack.load_full();
+        let mut sent = self.sent.lock().unwrap();
+
+        // Stacks are only published when they change, so if we already sent this one there's nothing to do.
+        let unchanged = match (&current, &*sent) {
+            (Some(a), Some(b)) => Arc::ptr_eq(a, b),
+            (None, None) => true,
+            _ => false,
+        };
+        if unchanged {
+            return None;
+        }
+
+        let mut delta: frontend::UiStackDelta = Default::default();
+        {
+            let old_entries = sent.as_deref().map_or(&[][..], |s| &s.entries[..]);
+            let new_entries = current.as_deref().map_or(&[][..], |s| &s.entries[..]);
+            let old_keys: HashSet<&str> = old_entries.iter().map(|e| e.key.as_str()).collect();
+            let new_keys: HashSet<&str> = new_entries.iter().map(|e| e.key.as_str()).collect();
+
+            delta.removed_keys.extend(
+                old_entries
+                    .iter()
+                    .filter(|e| !new_keys.contains(e.key.as_str()))
+                    .map(|e| e.key.clone()),
+            );
+            delta.added.extend(
+                new_entries
+                    .iter()
+                    .filter(|e| !old_keys.contains(e.key.as_str()))
+                    .cloned(),
+            );
+        }
+
+        *sent = current;
+        Some(delta)
+    }
+
+    /// Forget what the frontend was sent, so that the next delta is against an empty stack and carries every entry.
+    ///
+    /// For a frontend which lost a delta and has dropped its whole stack.
+    pub fn resync(&self) {
+        *self.sent.lock().unwrap() = None;
     }
 
     pub fn do_cancel(&self, target: String) -> Result<()> {
@@ -192,3 +255,105 @@ impl UiStackHandle {
         Ok(())
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    struct TestElement;
+
+    impl UiElement for TestElement {
+        fn get_initial_state(&self) -> Result<frontend::UiElement> {
+            Ok(frontend::UiElement {
+                element: Some(frontend::ui_element::Element::GameplayArea(
+                    Default::default(),
+                )),
+            })
+        }
+    }
+
+    fn new_stack() -> (UiStack, UiStackHandle) {
+        UiStack::new_with_handle(Arc::new(WorkNotifier::new()))
+    }
+
+    fn keys(entries: &[frontend::UiStackEntry]) -> Vec<String> {
+        entries.iter().map(|e| e.key.clone()).collect()
+    }
+
+    #[test]
+    fn first_delta_from_empty() -> Result<()> {
+        let (mut stack, handle) = new_stack();
+        assert!(handle.get_delta().is_none());
+
+        stack.push_element(Arc::new(TestElement))?;
+        stack.push_element(Arc::new(TestElement))?;
+        stack.tick()?;
+
+        let delta = handle.get_delta().expect("Stack changed");
+        assert!(delta.removed_keys.is_empty());
+        assert_eq!(
+            keys(&delta.added),
+            keys(&handle.state.stack.load_full().unwrap().entries)
+        );
+        assert_eq!(delta.added.len(), 2);
+        Ok(())
+    }
+
+    #[test]
+    fn remove_from_middle_and_push() -> Result<()> {
+        let (mut stack, handle) = new_stack();
+        for _ in 0..3 {
+            stack.push_element(Arc::new(TestElement))?;
+        }
+        stack.tick()?;
+        let first = keys(&handle.get_delta().expect("Stack changed").added);
+
+        handle.do_cancel(first[1].clone())?;
+        stack.push_element(Arc::new(TestElement))?;
+        stack.tick()?;
+
+        let delta = handle.get_delta().expect("Stack changed");
+        assert_eq!(delta.removed_keys, vec![first[1].clone()]);
+        assert_eq!(delta.added.len(), 1);
+        assert!(!first.contains(&delta.added[0].key));
+
+        let current = keys(&handle.state.stack.load_full().unwrap().entries);
+        assert_eq!(
+            current,
+            vec![
+                first[0].clone(),
+                first[2].clone(),
+                delta.added[0].key.clone()
+            ]
+        );
+        Ok(())
+    }
+
+    #[test]
+    fn unchanged_stack_returns_none() -> Result<()> {
+        let (mut stack, handle) = new_stack();
+        stack.push_element(Arc::new(TestElement))?;
+        stack.tick()?;
+        assert!(handle.get_delta().is_some());
+
+        stack.tick()?;
+        assert!(handle.get_delta().is_none());
+        Ok(())
+    }
+
+    #[test]
+    fn resync_resends_whole_stack() -> Result<()> {
+        let (mut stack, handle) = new_stack();
+        stack.push_element(Arc::new(TestElement))?;
+        stack.push_element(Arc::new(TestElement))?;
+        stack.tick()?;
+        let first = keys(&handle.get_delta().expect("Stack changed").added);
+
+        handle.resync();
+        let delta = handle.get_delta().expect("Resync resends the stack");
+        assert!(delta.removed_keys.is_empty());
+        assert_eq!(keys(&delta.added), first);
+        assert!(handle.get_delta().is_none());
+        Ok(())
+    }
+}
@@ -0,0 +1,83 @@
+//! Lets the frontend block until the client has something for it to do.
+//!
+//! The frontend used to poll the client at a fixed rate, which meant waking up the UI thread constantly even when
+//! nothing changed.  Instead, anything which produces work for the frontend (a new UI stack, a service request) calls
+//! [WorkNotifier::notify], and the frontend blocks in [WorkNotifier::wait] until that happens.
+use std::sync::{Condvar, Mutex};
+use std::time::Duration;
+
+#[derive(Default)]
+pub struct WorkNotifier {
+    /// Set when there is work the frontend hasn't yet been told about.
+    pending: Mutex<bool>,
+    condvar: Condvar,
+}
+
+impl WorkNotifier {
+    pub fn new() -> Self {
+        Default::default()
+    }
+
+    /// Note that there is work for the frontend, waking a waiter if there is one.
+    pub fn notify(&self) {
+        let mut pending = self.pending.lock().unwrap();
+        *pending = true;
+        self.condvar.notify_all();
+    }
+
+    /// Wait up to `timeout` for work.
+    ///
+    /// Returns true if there is work, in which case the pending flag is cleared; work which arrives after this point
+    /// will wake the next call.
+    pub fn wait(&self, timeout: Duration) -> bool {
+        let pending = self.pending.lock().unwrap();
+        let (mut pending, _) = self
+            .condvar
+            .wait_timeout_while(pending, timeout, |p| !*p)
+            .unwrap();
+        std::mem::replace(&mut *pending, false)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    use std::sync::Arc;
+    use std::time::Instant;
+
+    #[test]
+    fn notify_before_wait() {
+        let n = WorkNotifier::new();
+        n.notify();
+        assert!(n.wait(Duration::from_secs(0)));
+    }
+
+    #[test]
+    fn timeout_returns_false() {
+        let n = WorkNotifier::new();
+        let timeout = Duration::from_millis(20);
+        let start = Instant::now();
+        assert!(!n.wait(timeout));
+        assert!(start.elapsed() >= timeout);
+    }
+
+    #[test]
+    fn wait_clears_pending() {
+        let n = WorkNotifier::new();
+        n.notify();
+        n.notify();
+        assert!(n.wait(Duration::from_secs(0)));
+        assert!(!n.wait(Duration::from_secs(0)));
+    }
+
+    #[test]
+    fn notify_wakes_waiter() {
+        let n = Arc::new(WorkNotifier::new());
+        let n2 = n.clone();
+        let waiter = std::thread::spawn(move || n2.wait(Duration::from_secs(10)));
+        std::thread::sleep(Duration::from_millis(20));
+        n.notify();
+        assert!(waiter.join().unwrap());
+    }
+}
@@ -0,0 +1,6 @@
+REM Compiles the frontend's hot modules with mypyc.  Install frontend/build-requirements.txt first.
+REM
+REM The compiled modules are written next to their sources and take precedence over them on import, so after editing
+REM any of these files either rerun this or run clean_frontend.bat; otherwise the stale compiled version keeps running.
+call clean_frontend.bat
+cd frontend/python && python -m mypyc --ignore-missing-imports --follow-imports=skip ui_element.py menu.py ui_stack_manager.py service_provider.py
@@ -1,4 +1,5 @@
-import time
+import logging
+import queue
 import threading
 
 import wx
@@ -8,12 +9,9 @@ from ammo_frontend import start_client
 from service_provider import ServiceProvider
 from ui_stack_manager import UiStackManager
 
-# This is a hack to get periodic calls of the polling function into the main thread. We will want to lower this to Rust
-# eventually, but it probably works well enough for a good while.
-def polling_thread_fn(client):
-    while True:
-        wx.CallAfter(lambda: client.tick())
-        time.sleep(0.05)
+# The polling thread wakes the main thread whenever it hands over work; this is only a safety net which drains anything
+# a wakeup somehow missed, in milliseconds.
+TICK_INTERVAL_MS = 1000
 
 
 class Client:
@@ -23,14 +21,61 @@ class Client:
         self.window = wx.Frame(None, title="Ammo")
         self.ui_stack_manager = UiStackManager(self.client, self.window)
         self.service_provider = ServiceProvider(self.client)
+        # (function, argument) pairs queued by the polling thread, to be called on the main thread in order.
+        self.pending = queue.SimpleQueue()
+
+    # Runs on the polling thread.  Blocks until the Rust side has work for us, then does all of the fetching and
+    # decoding here so that the main thread only has to apply the results.
+    def poll(self):
+        while True:
+            try:
+                self.poll_once()
+            except Exception:
+                # If this thread dies, the frontend never hears from the backend again, so log and keep going.
+                logging.exception("Error polling the client")
+
+    def poll_once(self):
+        if not self.client.wait_for_work(0.25):
+            return
+        # The wait has already cleared the backend's pending flag, so each source is fetched on its own; a failure in
+        # one mustn't leave the other's work (e.g. a final shutdown request) waiting until something else wakes us.
+        queued = False
+        try:
+            ui_delta = self.ui_stack_manager.poll()
+            if ui_delta is not None:
+                self.pending.put((self.ui_stack_manager.apply_delta, ui_delta))
+                queued = True
+        except Exception:
+            logging.exception("Error polling the UI stack")
+        try:
+            batch = self.service_provider.poll()
+            if batch is not None:
+                self.pending.put((self.service_provider.handle_batch, batch))
+                queued = True
+        except Exception:
+            logging.exception("Error polling service requests")
+        if queued:
+            # One wakeup per handover; tick drains everything queued so far.
+            wx.CallAfter(self.tick)
 
     def tick(self):
-        self.ui_stack_manager.tick()
-        self.service_provider.tick()
+        while True:
+            try:
+                func, arg = self.pending.get_nowait()
+            except queue.Empty:
+                return
+            func(arg)
+
+    def on_timer(self, evt):
+        self.tick()
 
     def main_loop(self):
-        polling_thread = threading.Thread(target=lambda: polling_thread_fn(self))
+        polling_thread = threading.Thread(target=self.poll)
         polling_thread.daemon = True
         polling_thread.start()
+        # Fires on the main thread, like the wakeups posted by the polling thread.
+        self.timer = wx.Timer(self.window)
+        self.window.Bind(wx.EVT_TIMER, self.on_timer, self.timer)
+        self.timer.Start(TICK_INTERVAL_MS)
         self.window.Show()
         self.app.MainLoop()
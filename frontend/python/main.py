@@ -1,10 +1,23 @@
+import os
+import warnings
+
+# Prefer the upb protobuf backend.  Must happen before anything imports the generated protos.  upb is already the
+# default from protobuf 4.21 on, and an explicit choice in the environment is left alone.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
 from cytolk import tolk
+from google.protobuf.internal import api_implementation
 import wx
 
 from client import Client
 
 
 def main():
+    if api_implementation.Type() not in ("upb", "cpp"):
+        warnings.warn(
+            f"Using the {api_implementation.Type()} protobuf backend, which is much slower at decoding"
+        )
+
     with tolk.tolk():
         app = wx.App()
         client = Client(app)
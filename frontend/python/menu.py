@@ -1,3 +1,5 @@
+from typing import Any, Hashable, Optional
+
 import wx
 from cytolk import tolk
 
@@ -6,7 +8,7 @@ from ui_element import UiElement
 
 
 class MenuControl(UiElement):
-    def __init__(self, parent, client, proto, key):
+    def __init__(self, parent: wx.Window, client: Any, proto: Menu, key: str):
         self.client = client
         self.proto = proto
         self.key = key
@@ -18,11 +20,13 @@ class MenuControl(UiElement):
         self.ok_button = wx.Button(parent=self.panel, label="Ok")
 
         self.list.InsertColumn(0, "")
-        for ind, i in enumerate(proto.items):
-            li = wx.ListItem()
-            li.SetText(i.label)
-            li.SetId(ind)
-            self.list.InsertItem(li)
+        # Freeze so that wx doesn't relayout and repaint the list for every row.
+        self.list.Freeze()
+        try:
+            for ind, i in enumerate(proto.items):
+                self.list.InsertItem(ind, i.label)
+        finally:
+            self.list.Thaw()
 
         self.ok_button.Bind(wx.EVT_BUTTON, self.on_ok, id=wx.ID_ANY)
         self.list.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_list_click, id=wx.ID_ANY)
@@ -37,41 +41,59 @@ class MenuControl(UiElement):
             self.list.Select(0)
             self.list.Focus(0)
 
-    def set_parent_if_changed(self, new_parent):
+    def set_parent_if_changed(self, new_parent: wx.Window) -> None:
         if self.current_parent is not new_parent:
             self.current_parent = new_parent
             self.panel.SetParent(new_parent)
 
-    def focus(self):
+    @staticmethod
+    def reuse_key_for(proto: Menu) -> Optional[Hashable]:
+        # Only what ends up in the controls matters; item values are picked up again by set_proto.
+        return (proto.can_cancel, tuple(i.label for i in proto.items))
+
+    def park(self, new_parent: wx.Window) -> None:
+        self.panel.Hide()
+        self.set_parent_if_changed(new_parent)
+
+    def reuse(self, parent: wx.Window, proto: Menu, key: str) -> None:
+        self.key = key
+        self.set_proto(proto)
+        self.set_parent_if_changed(parent)
+        if len(proto.items):
+            self.list.Select(0)
+            self.list.Focus(0)
+        self.panel.Show()
+
+    def focus(self) -> None:
         self.list.SetFocus()
 
-    def set_proto(self, proto):
+    def set_proto(self, proto: Menu) -> None:
         self.proto = proto
 
-    def destroy(self):
+    def destroy(self) -> None:
         self.panel.Destroy()
 
-    def do_ok(self):
+    def do_ok(self) -> None:
         selected = self.list.GetFirstSelected()
         if selected == -1:
             return
         value = self.proto.items[selected].value
         self.client.ui_do_complete(self.key, value)
 
-    def on_ok(self, param):
+    def on_ok(self, param: wx.CommandEvent) -> None:
         self.do_ok()
 
-    def do_cancel(self):
+    def do_cancel(self) -> None:
         assert self.proto.can_cancel
         self.client.ui_do_cancel(self.key)
 
-    def on_cancel(self, param):
+    def on_cancel(self, param: wx.CommandEvent) -> None:
         self.do_cancel()
 
-    def on_list_click(self, param):
+    def on_list_click(self, param: wx.ListEvent) -> None:
         self.do_ok()
 
-    def on_list_key(self, evt: wx.KeyEvent):
+    def on_list_key(self, evt: wx.KeyEvent) -> None:
         kc = evt.GetKeyCode()
         if kc == wx.WXK_ESCAPE and self.proto.can_cancel:
             self.do_cancel()
@@ -1,21 +1,43 @@
-from protos.frontend_pb2 import ServiceRequestBatch
+from typing import Any, Callable, Dict, Optional
+
+from protos.frontend_pb2 import ServiceRequest, ServiceRequestBatch
 
 from services import speak, shutdown
 
 
+def handle_speak(req: ServiceRequest) -> None:
+    s = req.speak
+    speak(s.text, s.interrupt)
+
+
+def handle_shutdown(req: ServiceRequest) -> None:
+    shutdown()
+
+
+# Maps the name of the set field of the service oneof to the function handling it.
+REQUEST_HANDLERS: Dict[str, Callable[[ServiceRequest], None]] = {
+    "speak": handle_speak,
+    "shutdown": handle_shutdown,
+}
+
+
 class ServiceProvider:
-    def __init__(self, client):
+    def __init__(self, client: Any):
         self.client = client
 
-    def tick(self):
+    # Runs on the polling thread.  Returns None if there are no requests.  Each batch gets its own message because it is
+    # handed over to the main thread.
+    def poll(self) -> Optional[ServiceRequestBatch]:
         encoded_requests = self.client.dequeue_service_requests()
-        requests = ServiceRequestBatch.FromString(encoded_requests)
-        for req in requests.requests:
+        if encoded_requests is None:
+            return None
+        return ServiceRequestBatch.FromString(encoded_requests)
+
+    def handle_batch(self, batch: ServiceRequestBatch) -> None:
+        for req in batch.requests:
             self.handle_request(req)
 
-    def handle_request(self, req):
-        field = req.WhichOneof("service")
-        if field == "speak":
-            speak(req.speak.text, req.speak.interrupt)
-        elif field == "shutdown":
-            shutdown()
+    def handle_request(self, req: ServiceRequest) -> None:
+        handler = REQUEST_HANDLERS.get(req.WhichOneof("service"))
+        if handler is not None:
+            handler(req)
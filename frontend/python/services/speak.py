@@ -1,7 +1,6 @@
-import wx
-
 from cytolk import tolk
 
-
-def speak(text, interrupt):
-    tolk.speak(text, interrupt)
+# Tolk isn't thread safe, and its screen reader drivers use COM objects created on the thread which loaded it, so speech
+# has to happen on the main thread rather than being called directly from Rust's threads.  We can at least skip wrapping
+# the compiled cytolk function in a Python one.
+speak = tolk.speak
@@ -1,25 +1,48 @@
 from abc import abstractmethod, ABC
+from typing import Any, Hashable, Optional
 
 import wx
 
 
 class UiElement:
+    # The panel holding this element's controls.  The element above this one on the stack is parented to it.
+    panel: wx.Panel
+    # The proto this element was last given.
+    proto: Any
+
+    # Not marked abstract: mypyc can't compile an abstract __init__ on a base class.
+    def __init__(self, parent: wx.Window, client: Any, proto: Any, key: str):
+        pass
+
     @abstractmethod
-    def __init__(self, parent, client, proto, key):
+    def focus(self) -> None:
         pass
 
     @abstractmethod
-    def focus(self):
+    def destroy(self) -> None:
         pass
 
     @abstractmethod
-    def destroy(self):
+    def set_parent_if_changed(self, new_parent: wx.Window) -> None:
         pass
 
     @abstractmethod
-    def set_parent_if_changed(self, new_parent):
+    def set_proto(self, proto: Any) -> None:
+        pass
+
+    # Elements which can be kept around after leaving the stack and reused for a later entry return a hashable key
+    # here.  Two protos with the same key must be interchangeable after a call to reuse.  None means never reuse.
+    @staticmethod
+    def reuse_key_for(proto: Any) -> Optional[Hashable]:
+        return None
+
+    # Hide this element and move it under new_parent while it waits to be reused.  Only called if reuse_key_for
+    # returned a key.
+    @abstractmethod
+    def park(self, new_parent: wx.Window) -> None:
         pass
 
+    # Bring a parked element back for a new stack entry.  Only called if reuse_key_for returned a key.
     @abstractmethod
-    def set_proto(self, proto):
+    def reuse(self, parent: wx.Window, proto: Any, key: str) -> None:
         pass
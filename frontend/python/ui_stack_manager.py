@@ -1,74 +1,157 @@
-from collections import namedtuple
-from protos.frontend_pb2 import UiStack
+import logging
+import sys
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Type
+
+import wx
+
+from protos.frontend_pb2 import UiStackDelta
 
 from menu import MenuControl
+from ui_element import UiElement
+
+
+# An element on the stack, the key the backend knows it by, and the window it is currently parented to.  Uses slots
+# rather than a namedtuple because these fields are read every time the stack changes.
+#
+# Tracking the parent here lets the stack manager skip asking the element to reparent itself when nothing moved.  It
+# holds the parent itself rather than its id(), since ids can be reused once a destroyed parent is collected.
+class UiEntry:
+    __slots__ = ("key", "element", "parent")
 
-UiEntry = namedtuple("UiEntry", ["key", "element"])
+    def __init__(self, key: str, element: UiElement, parent: wx.Window):
+        self.key = key
+        self.element = element
+        self.parent = parent
+
+
+# Maps the name of the set field of the element oneof to the UiElement handling it.
+ELEMENT_TYPES: Dict[str, Type[UiElement]] = {
+    "menu": MenuControl,
+}
+
+# How many elements which left the stack to keep around for reuse.
+ELEMENT_POOL_SIZE = 8
 
 
 class UiStackManager:
-    def __init__(self, client, window):
+    def __init__(self, client: Any, window: wx.Window):
         self.client = client
         self.window = window
-        self.stack = []
+        self.stack: List[UiEntry] = []
         # Used to track focusing the top of the stack.
-        self.last_top_key = None
-
-    def tick(self):
-        encoded_stack = self.client.get_ui_stack()
-        stack = UiStack.FromString(encoded_stack)
-        self.remove_missing_elements(stack)
-        self.insert_new_elements(stack)
-        self.fixup_parents()
-        new_top_key = None
-        new_top_target = lambda: self.window.SetFocus()
-        if len(self.stack):
+        self.last_top_key: Optional[str] = None
+        # Elements which left the stack, parked until an entry with an identical proto wants them, so that reopening
+        # e.g. the same menu doesn't rebuild its controls.  Keyed by element type and reuse key, oldest first.
+        self.element_pool: "OrderedDict[Tuple[type, Hashable], UiElement]" = (
+            OrderedDict()
+        )
+        # Pooled elements are parked under this never-shown frame rather than the window: a frame only sizes its
+        # client area to its child if it has exactly one, and hidden children count.  Being owned by the window, it is
+        # destroyed along with it and doesn't keep the app alive.
+        self.pool_holder = wx.Frame(window)
+        # Owned by the polling thread: the keys of every entry handed over to the main thread and not yet removed, so
+        # that a failed delta can be recovered from by dropping all of them and asking for the whole stack again.
+        self.polled_keys: Set[str] = set()
+
+    # Runs on the polling thread.  Fetches and decodes the latest delta, returning the keys it removes and the
+    # (key, UiElement proto) pairs it pushes, or None if nothing changed.  Doesn't touch any wx or stack state; each
+    # delta gets its own message because what it produces is handed over to the main thread.
+    #
+    # Keys are interned, so that matching a removal against the stack compares by identity rather than by contents.
+    #
+    # The backend counts a delta as sent once it has handed it over, so if fetching or decoding one fails the stack
+    # would otherwise stay out of sync for good.  Instead, everything handed over so far is removed and the backend is
+    # asked to send the whole stack again.
+    def poll(self) -> Optional[Tuple[Set[str], List[Tuple[str, Any]]]]:
+        try:
+            encoded_delta = self.client.get_ui_stack_delta()
+            if encoded_delta is None:
+                return None
+            delta = UiStackDelta.FromString(encoded_delta)
+            removed = {sys.intern(key) for key in delta.removed_keys}
+            added = [(sys.intern(entry.key), entry.element) for entry in delta.added]
+        except Exception:
+            logging.exception("Error fetching the UI stack delta, resyncing")
+            removed = self.polled_keys
+            self.polled_keys = set()
+            self.client.resync_ui_stack()
+            return removed, []
+        self.polled_keys -= removed
+        self.polled_keys.update(key for key, _ in added)
+        return removed, added
+
+    # Runs on the main thread.  Removals are applied first; additions are always pushes to the top of the stack.
+    def apply_delta(self, delta: Tuple[Set[str], List[Tuple[str, Any]]]) -> None:
+        removed, added = delta
+        if removed:
+            self.remove_elements(removed)
+        parent = self.stack[-1].element.panel if self.stack else self.window
+        for key, element_proto in added:
+            elem = self.construct_element(key, element_proto, parent)
+            self.stack.append(elem)
+            parent = elem.element.panel
+
+        new_top_key: Optional[str] = None
+        if self.stack:
             new_top_key = self.stack[-1].key
-            new_top_target = lambda: self.stack[-1].element.focus()
-        if self.last_top_key != new_top_key:
-            new_top_target()
+            if self.last_top_key != new_top_key:
+                self.stack[-1].element.focus()
+        elif self.last_top_key is not None:
+            self.window.SetFocus()
         self.last_top_key = new_top_key
 
-    def insert_new_elements(self, stack):
-        stack = stack.entries
-        for i in range(len(stack)):
-            key = stack[i].key
-            seen = False
-            for e in self.stack:
-                if e.key == key:
-                    seen = True
-                    break
-            if seen:
-                continue
-            constructed_element = self.construct_element(
-                stack[i], self.stack[i].element.panel if i > 0 else self.window
-            )
-            self.stack.insert(i, constructed_element)
-
-    def remove_missing_elements(self, stack):
-        seen_elements = {i.key for i in stack.entries}
-        new_stack = []
+    # Each element is parented to the panel of the one below it.  Removals can come from anywhere in the stack, so
+    # survivors above them are reparented before anything is destroyed, so that destroying a dropped panel can't take a
+    # surviving child down with it.
+    def remove_elements(self, removed: Set[str]) -> None:
+        new_stack: List[UiEntry] = []
+        dropped: List[UiEntry] = []
+        parent = self.window
         for elem in self.stack:
-            if elem.key not in seen_elements:
-                elem.element.destroy()
+            if elem.key in removed:
+                dropped.append(elem)
                 continue
+            if elem.parent is not parent:
+                elem.element.set_parent_if_changed(parent)
+                elem.parent = parent
             new_stack.append(elem)
+            parent = elem.element.panel
+        # Top down, so that a dropped element is moved or destroyed before the dropped element it may be parented to.
+        for elem in reversed(dropped):
+            self.release_element(elem.element)
         self.stack = new_stack
 
-    def fixup_parents(self):
-        parent = self.window
-        for i in self.stack:
-            i.element.set_parent_if_changed(parent)
-            parent = i.element
-
-    def construct_element(self, element, parent):
-        type = element.element.WhichOneof("element")
-        if type == "menu":
-            return UiEntry(
-                key=element.key,
-                element=MenuControl(
-                    parent, self.client, element.element.menu, element.key
-                ),
-            )
-        else:
+    # Park an element which left the stack in the pool if it can be reused, otherwise destroy it.
+    def release_element(self, element: UiElement) -> None:
+        reuse_key = element.reuse_key_for(element.proto)
+        if reuse_key is None:
+            element.destroy()
+            return
+        element.park(self.pool_holder)
+        pool_key = (type(element), reuse_key)
+        previous = self.element_pool.pop(pool_key, None)
+        if previous is not None:
+            previous.destroy()
+        self.element_pool[pool_key] = element
+        if len(self.element_pool) > ELEMENT_POOL_SIZE:
+            _, oldest = self.element_pool.popitem(last=False)
+            oldest.destroy()
+
+    def construct_element(
+        self, key: str, element_proto: Any, parent: wx.Window
+    ) -> UiEntry:
+        type = element_proto.WhichOneof("element")
+        element_type = ELEMENT_TYPES.get(type)
+        if element_type is None:
             raise RuntimeError(f"Element type {type} not recognized")
+        proto = getattr(element_proto, type)
+        reuse_key = element_type.reuse_key_for(proto)
+        element = None
+        if reuse_key is not None:
+            element = self.element_pool.pop((element_type, reuse_key), None)
+        if element is not None:
+            element.reuse(parent, proto, key)
+        else:
+            element = element_type(parent, self.client, proto, key)
+        return UiEntry(key=key, element=element, parent=parent)
@@ -12,57 +12,59 @@ struct Client {
 }
 
 thread_local! {
-    static DECODING_BUFFER: RefCell<Vec<u8>> = RefCell::new(vec![]);
     static SERVICE_REQUEST_MSG: RefCell<frontend::ServiceRequestBatch> = RefCell::new(frontend::ServiceRequestBatch {
         requests: Vec::new(),
     });
 }
 
+/// Encode a message straight into a Python bytes object, so that the only copy is the encoding itself.
 fn encode_message<'p>(py: Python<'p>, msg: &impl Message) -> PyResult<&'p PyBytes> {
-    let res = DECODING_BUFFER.with(|r| -> anyhow::Result<_> {
-        let mut b = r.borrow_mut();
-        b.clear();
-        b.reserve(msg.encoded_len());
-        msg.encode(&mut *b)?;
-        Ok(PyBytes::new(py, &b[..]))
-    })?;
-    Ok(res)
+    PyBytes::new_with(py, msg.encoded_len(), |mut buf: &mut [u8]| {
+        msg.encode(&mut buf).map_err(anyhow::Error::from)?;
+        Ok(())
+    })
 }
 
 #[pymethods]
 impl Client {
-    /// get the UI stack.
+    /// Get the changes to the UI stack since the last call.
     ///
-    /// Returns an empty stack if the underlying client doesn't yet have one for us to send.
-    pub fn get_ui_stack<'a>(&self, py: Python<'a>) -> PyResult<&'a PyBytes> {
-        let stack = self.client.get_ui_stack()?;
-        let default_stack: frontend::UiStack = Default::default();
-        let target_stack = if let Some(ref x) = stack {
-            &*x
-        } else {
-            &default_stack
-        };
+    /// Returns `None` if nothing changed, so that Python doesn't have to decode anything.
+    pub fn get_ui_stack_delta<'a>(&self, py: Python<'a>) -> PyResult<Option<&'a PyBytes>> {
+        self.client
+            .get_ui_stack_delta()?
+            .map(|delta| encode_message(py, &delta))
+            .transpose()
+    }
 
-        let res = DECODING_BUFFER.with(|buf_ref| -> anyhow::Result<_> {
-            let mut buf = buf_ref.borrow_mut();
-            let len = target_stack.encoded_len();
-            buf.clear();
-            buf.reserve(len);
-            target_stack.encode(&mut *buf)?;
-            Ok(PyBytes::new(py, &buf[..len]))
-        })?;
-        Ok(res)
+    /// Make the next delta carry the whole UI stack, for a frontend which dropped its own after failing to handle one.
+    pub fn resync_ui_stack(&self) {
+        self.client.resync_ui_stack()
     }
 
-    pub fn dequeue_service_requests<'p>(&self, py: Python<'p>) -> PyResult<&'p PyBytes> {
+    /// Get pending service requests.
+    ///
+    /// Returns `None` if there aren't any, so that Python doesn't have to decode anything.
+    pub fn dequeue_service_requests<'p>(&self, py: Python<'p>) -> PyResult<Option<&'p PyBytes>> {
         SERVICE_REQUEST_MSG.with(|r| {
             let mut msg = r.borrow_mut();
             msg.requests.clear();
             self.client.dequeue_service_requests(&mut msg.requests)?;
-            encode_message(py, &*msg)
+            if msg.requests.is_empty() {
+                return Ok(None);
+            }
+            encode_message(py, &*msg).map(Some)
         })
     }
 
+    /// Block for up to `timeout` seconds until the client has work for the frontend, releasing the GIL while waiting.
+    ///
+    /// Returns true if the frontend should tick.
+    pub fn wait_for_work(&self, py: Python, timeout: f64) -> bool {
+        let timeout = std::time::Duration::from_secs_f64(timeout);
+        py.allow_threads(|| self.client.wait_for_work(timeout))
+    }
+
     pub fn ui_do_complete(&self, target: String, value: String) -> PyResult<()> {
         Ok(self.client.do_complete(target, value)?)
     }